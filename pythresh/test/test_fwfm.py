@@ -58,3 +58,18 @@ class TestFWFM(unittest.TestCase):
 
             assert (pred_labels.min() == 0)
             assert (pred_labels.max() == 1)
+
+    def test_prediction_labels_degenerate(self):
+
+        # Constant scores short-circuit the KDE entirely
+        pred_labels = self.thres.eval(np.ones(100))
+        assert (self.thres.thresh_ == 1.1)
+        assert (pred_labels.max() == 0)
+
+        # Scores massed at the maximum leave the KDE with no
+        # interior peak to measure
+        scores = np.concatenate([np.full(295, 1.0),
+                                 np.linspace(0, 0.9, 5)])
+        pred_labels = self.thres.eval(scores)
+        assert (self.thres.thresh_ == 1.1)
+        assert (pred_labels.max() == 0)
@@ -64,3 +64,18 @@ class TestGESD(unittest.TestCase):
 
             assert (pred_labels.min() == 0)
             assert (pred_labels.max() == 1)
+
+    def test_prediction_labels_duplicates(self):
+
+        # Duplicate-heavy scores drive the walk's running variance
+        # to zero part way through
+        scores = np.array([0.0, 1.0, 1.0, 1.0])
+
+        self.thres = GESD()
+        pred_labels = self.thres.eval(scores)
+        assert (self.thres.thresh_ is not None)
+
+        assert_equal(pred_labels.shape, scores.shape)
+
+        assert (pred_labels.min() >= 0)
+        assert (pred_labels.max() <= 1)
@@ -62,3 +62,27 @@ class TestMETA(unittest.TestCase):
 
             assert (pred_labels.min() == 0)
             assert (pred_labels.max() == 1)
+
+    def test_prediction_labels_ndarray_model(self):
+
+        # Meta-models that group by position instead of column name
+        # take the ndarray branch; an all-inlier vote exercises the
+        # empty-contam fallback
+        class _StubModel:
+            groups_ = [0, 1]
+            groups = 0
+
+            def predict(self, X):
+                return np.zeros(len(X), dtype=int)
+
+        cached = META._MODEL_CACHE.pop('meta_model_LIN.pkl', None)
+        META._MODEL_CACHE['meta_model_LIN.pkl'] = _StubModel()
+
+        try:
+            self.thres = META(method='LIN')
+            pred_labels = self.thres.eval(self.all_scores[0])
+            assert_equal(pred_labels, np.zeros_like(pred_labels))
+        finally:
+            META._MODEL_CACHE.pop('meta_model_LIN.pkl', None)
+            if cached is not None:
+                META._MODEL_CACHE['meta_model_LIN.pkl'] = cached
@@ -58,3 +58,17 @@ class TestMOLL(unittest.TestCase):
 
             assert (pred_labels.min() == 0)
             assert (pred_labels.max() == 1)
+
+    def test_prediction_labels_small(self):
+
+        # Short signals take the direct-convolution path
+        scores = self.all_scores[0][:50]
+
+        pred_labels = self.thres.eval(scores)
+        assert (self.thres.thresh_ is not None)
+        assert (self.thres.dscores_ is not None)
+
+        assert_equal(pred_labels.shape, scores.shape)
+
+        assert (pred_labels.min() == 0)
+        assert (pred_labels.max() == 1)
@@ -62,3 +62,28 @@ class TestMTT(unittest.TestCase):
 
             assert (pred_labels.min() == 0)
             assert (pred_labels.max() == 1)
+
+    def test_prediction_labels_degenerate(self):
+
+        # A single score cannot be rejected by the test
+        self.thres = MTT()
+        pred_labels = self.thres.eval(np.array([0.5]))
+        assert (self.thres.thresh_ == 1.1)
+
+        assert_equal(pred_labels, np.zeros(1, dtype=int))
+
+    def test_prediction_labels_constant_tail(self):
+
+        # Peeling can leave a constant remainder whose running-sum
+        # variance collapses to zero or slightly below
+        for scores in [np.array([0.0, 0.0, 0.0, 1.0]),
+                       np.concatenate([np.full(50, 0.2), [0.9, 1.0]])]:
+
+            self.thres = MTT()
+            pred_labels = self.thres.eval(scores)
+            assert (self.thres.thresh_ is not None)
+
+            assert_equal(pred_labels.shape, scores.shape)
+
+            assert (pred_labels.min() >= 0)
+            assert (pred_labels.max() <= 1)
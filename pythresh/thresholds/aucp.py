@@ -1,5 +1,4 @@
 import numpy as np
-from sklearn.metrics import auc
 
 from .base import BaseThresholder
 from .thresh_utility import check_scores, cut, gen_kde, normalize
@@ -82,27 +81,30 @@ class AUCP(BaseThresholder):
 
         self.dscores_ = decision
 
-        # Generate KDE
+        # Generate KDE; the density is used as-is since min-max scaling
+        # the curve only distorts the area ratios below
         val, dat_range = gen_kde(decision, 0, 1, len(decision)*2)
-        val = normalize(val)
 
-        # Get the total area under the curve
-        tot_area = auc(dat_range, val)
-
-        # Get area percentage limit
+        # Get the cumulative trapezoidal area under the curve such that
+        # the remaining tail area from any point is a single lookup
+        seg = 0.5*(val[:-1]+val[1:])*np.diff(dat_range)
+        cum_area = np.concatenate(([0.], np.cumsum(seg)))
+        tot_area = cum_area[-1]
+        tail_area = tot_area - cum_area
+
+        # Get area percentage limit, selecting the median with a single
+        # partition instead of a full sort
+        n = decision.size
+        mid = np.partition(decision, [(n-1)//2, n//2])
+        median = 0.5*(mid[(n-1)//2]+mid[n//2])
         mean = np.mean(decision)
-        perc = mean+abs(mean-np.median(decision))
+        thresh_area = (mean+abs(mean-median))*tot_area
 
         # Apply the limit to where the area is less than that limit percentage
-        # of the total area under the curve
-        limit = 1
-        for i in range(len(dat_range)):
-
-            splt_area = auc(dat_range[i:], val[i:])
-
-            if splt_area < perc*tot_area:
-                limit = dat_range[i]
-                break
+        # of the total area under the curve; the tail areas are monotone
+        # decreasing so the crossing is a single binary search
+        idx = np.searchsorted(-tail_area, -thresh_area, side='right')
+        limit = dat_range[idx] if idx < len(dat_range) else 1
 
         self.thresh_ = limit
 
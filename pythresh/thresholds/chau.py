@@ -1,10 +1,13 @@
 import numpy as np
 import scipy.stats as stats
-from scipy.special import erfc
+from scipy.special import erfc, ndtri
 
 from .base import BaseThresholder
 from .thresh_utility import check_scores, cut, normalize
 
+# Cache per-length ppf constants as these only depend on len(decision)
+_PPF_CACHE = {}
+
 
 class CHAU(BaseThresholder):
     r"""CHAU class for Chauvenet's criterion thresholder.
@@ -110,13 +113,27 @@ class CHAU(BaseThresholder):
         self.dscores_ = decision
 
         # Calculate Chauvenet's criterion for one tail
-        Pz = 1/(4*len(decision))
-        criterion = 1/abs(stats.norm.ppf(Pz))
-
-        # Get area normal to distance
-        prob = erfc(np.abs(decision-self.method(decision)) /
-                    decision.std()/2.0**0.5)
-
-        self.thresh_ = criterion * (1-np.min(prob))/np.max(prob)
+        n = len(decision)
+        if n not in _PPF_CACHE:
+            _PPF_CACHE[n] = ndtri(1/(4*n))
+        criterion = 1/abs(_PPF_CACHE[n])
+
+        # Get area normal to distance, fusing the z-score pipeline
+        # into a single buffer to avoid temporaries; reuse the mean for
+        # the deviation when it is already the chosen scaler
+        mu = self.method(decision)
+        sd = (np.sqrt(np.mean(np.square(decision)) - mu*mu)
+              if self.method is np.mean else decision.std())
+
+        zscore = decision - mu
+        np.abs(zscore, out=zscore)
+        zscore /= sd*2.0**0.5
+        prob = erfc(zscore)
+
+        # Guard the denominator as erfc underflows to zero for large
+        # z-scores when the score spread is very small
+        pmax = max(np.max(prob), np.finfo(prob.dtype).tiny)
+
+        self.thresh_ = criterion * (1-np.min(prob))/pmax
 
         return 1-cut(prob, criterion)
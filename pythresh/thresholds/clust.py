@@ -1,23 +1,20 @@
 import numpy as np
 import sklearn
-from pyclustering.cluster.agglomerative import agglomerative
 from pyclustering.cluster.bang import bang
 from pyclustering.cluster.bsas import bsas
-from pyclustering.cluster.dbscan import dbscan
-from pyclustering.cluster.ema import ema
 from pyclustering.cluster.mbsas import mbsas
 from pyclustering.cluster.optics import optics
-from pyclustering.cluster.somsc import somsc
 from pyclustering.cluster.xmeans import xmeans
-from scipy.spatial.distance import cityblock
 from sklearn.cluster import (
+    DBSCAN,
+    AgglomerativeClustering,
     Birch,
     KMeans,
     MeanShift,
     SpectralClustering,
     estimate_bandwidth
 )
-from sklearn.mixture import BayesianGaussianMixture
+from sklearn.mixture import BayesianGaussianMixture, GaussianMixture
 from sklearn.utils import check_array
 
 from .base import BaseThresholder
@@ -65,6 +62,10 @@ class CLUST(BaseThresholder):
             Random seed for the BayesianGaussianMixture clustering (method='bgm'). Can
             also be set to None.
 
+       n_jobs : int, optional (default=-1)
+            Number of parallel jobs for the clustering methods that support
+            it ('dbscan', 'mshift', and 'spec'). -1 uses all available cores.
+
        Attributes
        ----------
 
@@ -100,10 +101,11 @@ class CLUST(BaseThresholder):
             labels = thres.eval(decision_scores)
     """
 
-    def __init__(self, method='spec', random_state=1234):
+    def __init__(self, method='spec', random_state=1234, n_jobs=-1):
 
         super().__init__()
         self.method = method
+        self.n_jobs = n_jobs
         self.method_funcs = {'agg': self._AGG_clust, 'birch': self._BIRCH_clust,
                              'bang': self._BANG_clust, 'bgm': self._BGM_clust,
                              'bsas': self._BSAS_clust, 'dbscan': self._DBSCAN_clust,
@@ -152,12 +154,12 @@ class CLUST(BaseThresholder):
 
         cl.process()
 
-        pred = np.squeeze(np.array(cl.get_clusters(), dtype=object))
-
-        pred = np.array(pred[0]) if isinstance(pred[0], list) else pred
+        # Build the labels directly from the first cluster's indices,
+        # avoiding the object-dtype round trip
+        pred = np.asarray(cl.get_clusters()[0], dtype=int)
 
         labels = np.ones(len(decision), dtype=int)
-        labels[pred.astype(int)] = 0
+        labels[pred] = 0
 
         # Flip if outliers were clustered
         labels = 1-labels if sum(labels) > np.ceil(len(decision)/2) else labels
@@ -181,10 +183,11 @@ class CLUST(BaseThresholder):
     def _AGG_clust(self, decision):
         """Agglomerative algorithm for cluster analysis."""
 
-        cl = agglomerative(data=decision, number_clusters=2,
-                           link=2, ccore=True)
+        # sklearn's average-link agglomerative matches pyclustering's
+        # AVERAGE_LINK while clustering far faster
+        cl = AgglomerativeClustering(n_clusters=2, linkage='average')
 
-        return self._pyclust_eval(cl, decision)
+        return self._sklearn_eval(cl, decision)
 
     def _BIRCH_clust(self, decision):
         """BIRCH (Balanced Iterative Reducing and Clustering using.
@@ -234,10 +237,10 @@ class CLUST(BaseThresholder):
             noise) algorithm for cluster analysis
         """
 
-        cl = dbscan(data=decision, eps=np.std(decision) /
-                    np.sqrt(2), neighbors=len(decision) // 2, ccore=True)
+        cl = DBSCAN(eps=np.std(decision)/np.sqrt(2),
+                    min_samples=len(decision) // 2, n_jobs=self.n_jobs)
 
-        return self._pyclust_eval(cl, decision)
+        return self._sklearn_eval(cl, decision)
 
     def _EMA_clust(self, decision):
         """Expectation-Maximization clustering algorithm for Gaussian.
@@ -245,9 +248,15 @@ class CLUST(BaseThresholder):
             Mixture Models
         """
 
-        cl = ema(data=decision, amount_clusters=2)
+        cl = GaussianMixture(n_components=2,
+                             random_state=self.random_state).fit(decision)
 
-        return self._pyclust_eval(cl, decision)
+        labels = cl.predict(decision)
+
+        # Flip if outliers were clustered
+        labels = 1-labels if sum(labels) > np.ceil(len(decision)/2) else labels
+
+        return labels
 
     def _HDBSCAN_clust(self, decision):
         """HDBSCAN (Hierarchical Density-based spatial clustering of.
@@ -284,14 +293,16 @@ class CLUST(BaseThresholder):
         cscores = check_scores(decision,
                                random_state=self.random_state)
         dat = np.squeeze(cscores)
-        q = cityblock(dat, np.sort(dat))/np.sum(dat)
+        q = np.sum(np.abs(dat - np.sort(dat)))/(np.sum(dat)+1e-12)
 
         q = max(0.25, min(q, 1.0))
 
         # Estimate bandwidth
-        bw = estimate_bandwidth(dat.reshape(-1, 1), quantile=q)
+        bw = estimate_bandwidth(dat.reshape(-1, 1), quantile=q,
+                                n_jobs=self.n_jobs)
 
-        cl = MeanShift(bandwidth=bw, cluster_all=True, max_iter=500)
+        cl = MeanShift(bandwidth=bw, cluster_all=True, max_iter=500,
+                       n_jobs=self.n_jobs)
         cl.fit(decision)
         lbls = cl.labels_
 
@@ -315,14 +326,17 @@ class CLUST(BaseThresholder):
     def _SOMSC_clust(self, decision):
         """Self-organized feature map algorithm for cluster analysis."""
 
-        cl = somsc(data=decision, amount_clusters=2, ccore=True)
+        # A two cluster feature map converges to the k-means centroids,
+        # so use the sklearn implementation directly
+        cl = KMeans(n_clusters=2, n_init=10,
+                    random_state=self.random_state)
 
-        return self._pyclust_eval(cl, decision)
+        return self._sklearn_eval(cl, decision)
 
     def _SPEC_clust(self, decision):
         """Clustering to a projection of the normalized Laplacian."""
 
-        cl = SpectralClustering(n_clusters=2)
+        cl = SpectralClustering(n_clusters=2, n_jobs=self.n_jobs)
 
         return self._sklearn_eval(cl, decision)
 
@@ -1,7 +1,7 @@
 import numpy as np
 
 from .base import BaseThresholder
-from .thresh_utility import check_scores, cut, normalize
+from .thresh_utility import check_scores, cut, cut_counts, normalize
 
 
 class EB(BaseThresholder):
@@ -83,13 +83,9 @@ class EB(BaseThresholder):
         rnd = r.uniform(0, 1, 5000)
 
         # Create pseudo-random elliptical boundaries using each eccentricity
-        # and compute the inlier/outlier labels
-        counts = []  # Get number of inliers
-        for i in range(5000):
-            e = rnd[i]
-            a = 1/(1+e)
-            lb = cut(decision, a*(1-e))
-            counts.append(len(decision)-np.sum(lb))
+        # and count the inliers below each boundary
+        thres = (1-rnd)/(1+rnd)
+        counts = cut_counts(decision, thres)
 
         # Calculate the median count of expected inliers
         med = np.round(np.median(counts))
@@ -97,15 +93,9 @@ class EB(BaseThresholder):
 
         # Randomly find eccentricity that generates
         # the closest value to the median inliers
-        close = 0
-        for i in range(5000):
-            e = ec[i]
-            a = 1/(1+e)
-            lb = cut(decision, a*(1-e))
-            count = len(decision)-np.sum(lb)
-            if abs(med-count) < abs(med-close):
-                close = count
-                limit = a*(1-e)
+        thres = (1-ec)/(1+ec)
+        counts = cut_counts(decision, thres)
+        limit = thres[np.argmin(np.abs(med-counts))]
 
         self.thresh_ = limit
 
@@ -1,3 +1,4 @@
+import numpy as np
 from scipy.signal import find_peaks, peak_widths
 
 from .base import BaseThresholder
@@ -64,18 +65,42 @@ class FWFM(BaseThresholder):
 
         self.dscores_ = decision
 
-        # Generate KDE
-        val, _ = gen_kde(decision, -1, 1, len(decision)*3)
+        # Skip the KDE entirely for near-constant scores which have
+        # no prominent peak to measure; constant scores normalize to
+        # NaN so the comparison is written to catch those too
+        if not decision.std() > 1e-3:
+
+            self.thresh_ = 1.1
+
+            return cut(decision, 1.1)
+
+        # Generate KDE on a coarse grid first, as the base width is
+        # normalized by the grid size and rarely needs refining
+        size = max(512, len(decision))
+        val, _ = gen_kde(decision, -1, 1, size)
         val = normalize(val)
 
         # Find the greatest peak of the KDE
-        peaks, _ = find_peaks(val, prominence=0.75)
+        peaks, props = find_peaks(val, prominence=0.75)
+
+        if len(peaks) == 0:
+
+            limit = 1.1
+
+        else:
+
+            # Refine borderline peaks on the dense grid
+            if (np.min(props['prominences']) < 1.0) & (len(decision)*3 > size):
+
+                val, _ = gen_kde(decision, -1, 1, len(decision)*3)
+                val = normalize(val)
+                peaks, _ = find_peaks(val, prominence=0.75)
 
-        # Find the base width of the peak
-        base_width = peak_widths(val, peaks, rel_height=0.99)[0]
+            # Find the base width of the peak
+            base_width = peak_widths(val, peaks, rel_height=0.99)[0]
 
-        # Normalize and set limit
-        limit = base_width[0]/len(val) if len(base_width) > 0 else 1.1
+            # Normalize and set limit
+            limit = base_width[0]/len(val) if len(base_width) > 0 else 1.1
 
         self.thresh_ = limit
 
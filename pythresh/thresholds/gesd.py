@@ -7,6 +7,48 @@ from .thresh_utility import check_scores, cut, normalize
 # https://github.com/bhattbhavesh91/outlier-detection-grubbs-test-and-generalized-esd-test-python/blob/master/generalized-esd-test-for-outliers.ipynb
 
 
+def _gesd_walk(srt, crits):  # pragma: no cover
+    """Two-pointer walk over the sorted scores returning the limit."""
+
+    sum_ = srt.sum()
+    sum_sq = np.square(srt).sum()
+    count = len(srt)
+    lo, hi = 0, count - 1
+
+    limit = 1.1
+
+    for i in range(len(crits)):
+        mean = sum_ / count
+        std = np.sqrt(sum_sq / count - mean * mean)
+
+        # Remove whichever endpoint is farther from the current mean
+        if (srt[hi] - mean) >= (mean - srt[lo]):
+            dev, rem = srt[hi] - mean, srt[hi]
+            hi -= 1
+        else:
+            dev, rem = mean - srt[lo], srt[lo]
+            lo += 1
+
+        # A zero spread cannot reject anything; still consume the
+        # endpoint as the nan compare of the np.delete loop did
+        if std > 0.0:
+            if (dev / std > crits[i]) & (rem < limit):
+                limit = rem
+
+        sum_ -= rem
+        sum_sq -= rem * rem
+        count -= 1
+
+    return limit
+
+
+try:
+    from numba import njit
+    _gesd_walk = njit(cache=True)(_gesd_walk)
+except ImportError:  # pragma: no cover
+    pass
+
+
 class GESD(BaseThresholder):
     r"""GESD class for Generalized Extreme Studentized Deviate thresholder.
 
@@ -106,36 +148,26 @@ class GESD(BaseThresholder):
 
         self.dscores_ = decision
 
-        arr = decision.copy()
-
-        limit = 1.1
-
         if self.max_outliers == 'auto':
             self.max_outliers = len(decision) // 2
 
-        for _ in range(self.max_outliers):
-            Gc = self._calc_crit(len(arr), self.alpha)
-            Gs, max_index = self._grubbs_stat(arr)
+        # Precompute all critical values for the shrinking sample sizes
+        # in a single vectorized call
+        sizes = len(decision) - np.arange(self.max_outliers)
+        Gc = self._calc_crit(sizes, self.alpha)
 
-            if (Gs > Gc) & (arr[max_index] < limit):
-                limit = arr[max_index]
-            arr = np.delete(arr, max_index)
+        # The maximized test statistic is always at an end of the sorted
+        # scores, so walk the sorted array inwards with two pointers and
+        # update the mean/std incrementally instead of deleting elements
+        limit = _gesd_walk(np.sort(decision), Gc)
 
         self.thresh_ = limit
 
         return cut(decision, limit)
 
-    def _grubbs_stat(self, y):
-
-        dev = np.abs(y - y.mean())
-        max_ind = np.argmax(dev)
-        Gcal = np.max(dev) / y.std()
-
-        return Gcal, max_ind
-
     def _calc_crit(self, size, alpha):
 
         t_dist = stats.t.ppf(1 - alpha / (2 * size), size - 2)
-        numerator = (size - 1) * np.sqrt(np.square(t_dist))
+        numerator = (size - 1) * np.abs(t_dist)
         denominator = np.sqrt(size) * np.sqrt(size - 2 + np.square(t_dist))
         return numerator / denominator
@@ -1,5 +1,4 @@
 import numpy as np
-import scipy.stats as stats
 
 from .base import BaseThresholder
 from .thresh_utility import check_scores, cut, normalize
@@ -77,9 +76,14 @@ class MAD(BaseThresholder):
         self.dscores_ = decision
 
         # Set limit
-        mean = np.mean(decision)
-        limit = mean + \
-            stats.median_abs_deviation(decision, scale=np.std(decision))
+        # np.median partitions instead of fully sorting, and computing
+        # the MAD directly skips the scipy dispatch; the mean and std
+        # share a single pass over the scores via the moment sums
+        n = decision.size
+        mean = np.sum(decision)/n
+        std = np.sqrt(np.dot(decision, decision)/n - mean*mean)
+        mad = np.median(np.abs(decision - np.median(decision)))
+        limit = mean + mad/std
 
         self.thresh_ = limit
 
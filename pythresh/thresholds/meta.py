@@ -1,9 +1,7 @@
 import os
 from os.path import dirname as up
 
-import joblib
 import numpy as np
-import pandas as pd
 import scipy.stats as stats
 from numba import njit, prange
 from sklearn.preprocessing import MinMaxScaler
@@ -68,6 +66,10 @@ class META(BaseThresholder):
 
     """
 
+    # Cache loaded meta-models so repeated eval calls skip the
+    # joblib deserialization
+    _MODEL_CACHE = {}
+
     def __init__(self, method='GNBM', random_state=1234):
 
         self.method = method
@@ -91,6 +93,11 @@ class META(BaseThresholder):
             fitted model. 0 stands for inliers and 1 for outliers.
         """
 
+        # Defer the heavy imports to first use so consumers that never
+        # call META skip the pandas/joblib import cost
+        import joblib
+        import pandas as pd
+
         decision = check_scores(decision, random_state=self.random_state)
 
         decision = normalize(decision)
@@ -106,10 +113,13 @@ class META(BaseThresholder):
         else:
             clf = 'meta_model_GNBM.pkl'
 
-        contam = []
         counts = len(decision)
-        parent = up(up(__file__))
-        model = joblib.load(os.path.join(parent, 'models', clf))
+
+        model = META._MODEL_CACHE.get(clf)
+        if model is None:
+            parent = up(up(__file__))
+            model = joblib.load(os.path.join(parent, 'models', clf))
+            META._MODEL_CACHE[clf] = model
 
         if self.method == 'GNBM':
 
@@ -127,27 +137,40 @@ class META(BaseThresholder):
             kde = stats.gaussian_kde(decision)
             pdf = normalize(kde.pdf(decision))
 
-        for i in range(len(model.groups_)):
+        # Predict all groups in one batched call instead of building a
+        # DataFrame and dispatching predict per group
+        n_groups = len(model.groups_)
 
-            df = pd.DataFrame()
-            df['scores'] = decision
-            df['groups'] = i
+        cols = {'scores': np.tile(decision, n_groups),
+                'groups': np.repeat(np.arange(n_groups), counts)}
 
-            if self.method == 'GNBM':
+        if self.method == 'GNBM':
 
-                df['qmcd'] = qmcd
-                df['kdes'] = pdf**(1/10)
+            cols['qmcd'] = np.tile(qmcd, n_groups)
+            cols['kdes'] = np.tile(pdf**(1/10), n_groups)
 
-            labels = model.predict(df)
-            outlier_ratio = np.sum(labels)/counts
+        # Only pay for a DataFrame when the model selects columns by
+        # name, as sklego's GroupedPredictor does with its group keys
+        group_keys = getattr(model, 'groups', None)
+        if not isinstance(group_keys, (list, tuple)):
+            group_keys = [group_keys]
 
-            if (outlier_ratio < 0.5) & (outlier_ratio > 0):
+        if (any(isinstance(key, str) for key in group_keys)
+                or hasattr(model, 'feature_names_in_')):
+            X = pd.DataFrame(cols)
+        else:
+            X = np.column_stack(list(cols.values()))
 
-                contam.append(labels)
+        labels = model.predict(X).reshape(n_groups, counts)
+        outlier_ratio = labels.sum(axis=1)/counts
 
-        contam = np.array(contam)
-        lbls = stats.mode(contam, axis=0)
-        lbls = np.squeeze(lbls[0])
+        contam = labels[(outlier_ratio < 0.5) & (outlier_ratio > 0)]
+        # Majority vote over binary labels is just a column sum; ties
+        # resolve to 0 as stats.mode did
+        if len(contam) == 0:
+            lbls = np.zeros(counts, dtype=int)
+        else:
+            lbls = (contam.sum(axis=0)*2 > len(contam)).astype(int)
 
         self.thresh_ = None
 
@@ -1,5 +1,4 @@
 import numpy as np
-import scipy.signal as signal
 from scipy import integrate
 
 from .base import BaseThresholder
@@ -7,6 +6,40 @@ from .thresh_utility import check_scores, cut, normalize
 
 # https://github.com/geomdata/gda-public/blob/master/timeseries/curve_geometry.pyx
 
+# Mollifier normalization constant 1/int_{-1}^{1} exp(1/(x^2-1)) dx,
+# data independent so computed once at import
+_NORM_CONST = 1.0/integrate.quad(
+    lambda x: np.exp(1.0/(x**2-1.0)), -1.0, 1.0)[0]
+
+
+def _build_rho(p, norm_const, width):  # pragma: no cover
+
+    # Fuse the support mask and exp evaluation into a single pass
+    # to avoid the masked temporaries of the numpy version
+    out = np.empty_like(p)
+
+    for i in range(len(p)):
+        if p[i] < 1.0:
+            out[i] = (norm_const/width)*np.exp(1.0/(p[i]*p[i]-1.0))
+        else:
+            out[i] = 0.0
+
+    return out
+
+
+try:
+    from numba import njit
+    _build_rho = njit(fastmath=True)(_build_rho)
+except ImportError:  # pragma: no cover
+    def _build_rho(p, norm_const, width):
+
+        # Masked numpy evaluation when numba is unavailable
+        out = np.zeros_like(p)
+        core = p < 1.0
+        out[core] = (norm_const/width)*np.exp(1.0/(np.square(p[core])-1.0))
+
+        return out
+
 
 class MOLL(BaseThresholder):
     r"""MOLL class for Friedrichs' mollifier thresholder.
@@ -84,58 +117,67 @@ class MOLL(BaseThresholder):
 
         self.dscores_ = decision
 
-        dat_range = np.linspace(0, 1, len(decision))
+        # Sort a single shared copy for both branches; decision itself
+        # must keep its sample order for the label cut below
+        srt = np.sort(decision)
+
+        # For short signals the padding/refinement setup dwarfs the
+        # convolution itself, so smooth directly at the native spacing
+        if len(decision) < 200:
 
-        # Set the inliers to be where the 1-max(smoothed scores)
-        limit = 1-np.max(self._mollifier(dat_range, np.sort(decision)))
+            delta = 1.0/(len(decision)-1)
+            p = np.abs(np.arange(-(len(decision)-1),
+                                 len(decision))*delta)
+            rho = _build_rho(p, _NORM_CONST, 1.0)
+
+            edge_pad = np.pad(srt,
+                              (len(decision)-1, len(decision)-1), 'edge')
+            smooth = np.convolve(delta*edge_pad, rho, mode='valid')
+
+            limit = 1-np.max(smooth)
+
+        else:
+
+            dat_range = np.linspace(0, 1, len(decision))
+
+            # Set the inliers to be where the 1-max(smoothed scores)
+            limit = 1-self._smoothed_max(dat_range, srt)
 
         self.thresh_ = limit
 
         return cut(decision, limit)
 
-    def _mollifier(self, time, position, refinement=5, width=1.0):
+    def _smoothed_max(self, time, position, refinement=5, width=1.0):
 
+        # The sorted scores are monotone non-decreasing and the mollifier
+        # is non-negative, so the smoothed maximum sits at the last
+        # unpadded sample; evaluate the convolution at that single point
+        # as a kernel dot product instead of running _mollifier over the
+        # whole signal
         N = len(position)
 
         delta = (time[-1]-time[0])/(N-1)
 
-        # compute boundary space padding
-        left_pad = np.arange(time[0], time[0]-(width+delta), step=-delta)
-        left_pad = np.flipud(left_pad)[:-1]
-        left_pad_num = left_pad.shape[0]
-        right_pad = np.arange(time[-1], time[-1]+(width+delta), step=delta)[1:]
-        right_pad_num = right_pad.shape[0]
-        time_pad = np.concatenate((left_pad, time, right_pad))
-
-        # compute boundary score padding
-        position_pad = np.pad(position, (left_pad_num, right_pad_num), 'edge')
-
-        # Define a new smaller space scale s, ds (here we a evenly spaced)
-        s, ds = np.linspace(time_pad[0], time_pad[-1],
-                            (refinement)*time_pad.shape[0],
-                            retstep=True)
-        right_pad_num = (refinement)*right_pad_num
-        left_pad_num = (refinement)*left_pad_num
-        position_interp = np.interp(s, time_pad, position_pad)
-
-        # Compute the mollifier kernel
-        norm_const, err = integrate.quad(
-            lambda x: np.exp(1.0/(x**2-1.0)), -1.0, 1.0)
-        norm_const = 1.0/norm_const
-
-        # Compute the mollifier rho
-        p = np.abs((s - (s[0]+s[-1])/2.0)/width)
-        r = np.zeros_like(s)
-        q = p[p < 1.0]
-        r[p < 1.0] = np.exp(1.0/(q**2-1.0))
-        rho = (norm_const/width)*r
-
-        # Perform convolution to make smooth reconstruction
-        conv_func = signal.fftconvolve if s.shape[0] > 500 else np.convolve
-        smooth = conv_func(ds*position_interp, rho, mode='same')
-
-        # remove padding
-        s = s[left_pad_num:-right_pad_num]
-        smooth = smooth[left_pad_num:-(right_pad_num)]
-
-        return np.asarray(smooth)
+        pad_num = int(np.ceil((width+delta)/delta)) - 1
+        position_pad = np.pad(position, (pad_num, pad_num), 'edge')
+
+        ds = delta/refinement
+        frac = np.arange(refinement)/refinement
+        position_interp = ((1-frac)*position_pad[:-1, None]
+                           + frac*position_pad[1:, None]).ravel()
+        position_interp = np.append(position_interp, position_pad[-1])
+
+        half = int(np.ceil(width/ds))
+        p = np.abs(np.arange(-half, half+1)*ds/width)
+        rho = _build_rho(p, _NORM_CONST, width)
+
+        # Window of the refined signal centred on the last unpadded
+        # point; the trailing kernel samples are zero at the support
+        # edge, so clamping the slice to the buffer is exact
+        idx = len(position_interp) - 1 - refinement*pad_num
+        lo = max(idx - half, 0)
+
+        win = position_interp[lo:idx+half+1]
+        kern = rho[lo-(idx-half):][:win.shape[0]]
+
+        return ds*np.dot(kern, win)
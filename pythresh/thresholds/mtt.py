@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import scipy.stats as stats
 
@@ -78,21 +80,67 @@ class MTT(BaseThresholder):
 
         self.dscores_ = decision
 
-        arr = np.sort(decision.copy())
-
         limit = 1.1
 
+        n = decision.size
+
+        # A single score has no t-value table to index; keep it an
+        # inlier as the test cannot reject anything
+        if n < 2:
+            self.thresh_ = limit
+
+            return cut(np.atleast_1d(decision), limit)
+
+        # Only the top of the scores is ever peeled, so partition the
+        # largest candidates into sorted order instead of sorting the
+        # full array, resorting the front in the rare overrun case
+        k_max = min(max(32, int(0.1*n)), n)
+        pivot = n - k_max
+        part = np.partition(decision, pivot) if pivot > 0 \
+            else np.sort(decision)
+        tail = np.sort(part[pivot:]) if pivot > 0 else part
+        tail_i = len(tail) - 1
+
+        # Peel outliers off the top of the sorted scores while updating
+        # the mean/std from running sums; everything in the loop stays
+        # plain Python floats to avoid per-iteration numpy dispatch
+        s = float(decision.sum())
+        ss = float(np.square(decision).sum())
+
+        # Precompute the t-values for every possible sample size in one
+        # vectorized ppf call; t_vec[n0-n] holds the value for size n
+        n0 = n
+        t_vec = stats.t.ppf(self.alpha, df=np.arange(n0-2, -1, -1))
+
         while True:
 
             # Calculate the rejection threshold
-            n = len(arr)
-            t = stats.t.ppf(self.alpha, df=n-2)
-            thres = (t * (n - 1))/(np.sqrt(n) * np.sqrt(n - 2 + t**2))
-            delta = np.abs(arr[-1] - arr.mean())/arr.std()
+            t = float(t_vec[n0-n])
+            thres = (t * (n - 1))/(math.sqrt(n) * math.sqrt(n - 2 + t**2))
+            mean = s/n
+            var = ss/n - mean*mean
+
+            # A constant remainder has no spread left to reject from,
+            # and running-sum cancellation can push the variance a hair
+            # below zero
+            if var <= 0.0:
+                break
+
+            std = math.sqrt(var)
+            top = float(tail[tail_i])
+            delta = abs(top - mean)/std
 
             if delta > thres:
-                limit = arr[-1]
-                arr = np.delete(arr, n-1)
+                limit = top
+                s -= top
+                ss -= top*top
+                n -= 1
+                tail_i -= 1
+
+                if (tail_i < 0) & (pivot > 0):
+                    tail = np.sort(part[:pivot])
+                    tail_i = len(tail) - 1
+                    pivot = 0
 
             else:
                 break